@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Protocol, Union
 
 from astropy.units import Quantity, Unit
@@ -85,8 +86,40 @@ def get_bandpass_coefficient(
         input/ouput unit over the bandpass.
     """
 
-    in_intensity_derivative = get_intensity_derivative(input_unit)
-    out_intensity_derivative = get_intensity_derivative(output_unit)
+    # The coefficient is a pure function of the band and the unit pair,
+    # so repeated simulations of the same band hit the memoized value.
+    return _bandpass_coefficient_cached(
+        freqs.value.tobytes(),
+        freqs.dtype.str,
+        freqs.unit.to_string(),
+        weights.value.tobytes(),
+        weights.dtype.str,
+        weights.unit.to_string(),
+        Unit(input_unit).to_string(),
+        Unit(output_unit).to_string(),
+    )
+
+
+@lru_cache(maxsize=32)
+def _bandpass_coefficient_cached(
+    freqs_bytes: bytes,
+    freqs_dtype: str,
+    freqs_unit: str,
+    weights_bytes: bytes,
+    weights_dtype: str,
+    weights_unit: str,
+    input_unit: str,
+    output_unit: str,
+) -> Quantity:
+    """Computes the bandpass coefficient, memoized on the raw band data."""
+
+    freqs = Quantity(np.frombuffer(freqs_bytes, dtype=freqs_dtype), unit=freqs_unit)
+    weights = Quantity(
+        np.frombuffer(weights_bytes, dtype=weights_dtype), unit=weights_unit
+    )
+
+    in_intensity_derivative = get_intensity_derivative(Unit(input_unit))
+    out_intensity_derivative = get_intensity_derivative(Unit(output_unit))
 
     coefficient = np.trapz(weights * in_intensity_derivative(freqs), freqs) / np.trapz(
         weights * out_intensity_derivative(freqs), freqs
@@ -161,10 +194,15 @@ def integrated_freq_scaling(
     varying spectral parameters.
     """
 
+    # The scaling factor is dimensionless, so the integration runs on raw
+    # values; the normalized weights carry the inverse unit of the
+    # frequencies by construction.
     freq_scaling = freq_scaling_func(freqs, **spectral_parameters)
-    scaling_factor = np.trapz(freq_scaling * weights, freqs)
+    scaling_factor = np.trapz(freq_scaling.value * weights.value, freqs.value)
     if np.ndim(scaling_factor) > 0:
-        return np.expand_dims(scaling_factor, axis=1)
+        # newaxis indexing returns a broadcast-ready view directly instead
+        # of going through the np.expand_dims dispatch machinery.
+        return scaling_factor[:, np.newaxis]
 
     return scaling_factor
 
@@ -188,12 +226,16 @@ def bandpass_interpolation_1d(
     else:
         integrals = np.zeros((len(spectral_parameter_grid), 1))
 
+    # The integration over the grid runs on raw values; units only matter
+    # at the freq_scaling_func boundary.
+    weights_value = weights.value
+    freqs_value = freqs.value
+    scalar_params = {
+        param: value for param, value in spectral_parameters.items() if param != key
+    }
     for idx, grid_point in enumerate(spectral_parameter_grid):
-        scalar_params = {
-            param: value for param, value in spectral_parameters.items() if param != key
-        }
         freq_scaling = freq_scaling_func(freqs, **{key: grid_point}, **scalar_params)
-        integrals[idx] = np.trapz(freq_scaling * weights, freqs)
+        integrals[idx] = np.trapz(freq_scaling.value * weights_value, freqs_value)
 
     # We transpose the array to make it into row format similar to how
     # regular IQU maps are stored
@@ -240,11 +282,13 @@ def bandpass_interpolation_2d(
     else:
         integrals = np.zeros((n, n, 1))
 
+    weights_value = weights.value
+    freqs_value = freqs.value
     for i in range(n):
         for j in range(n):
             grid_spectrals = {key: value[i, j] for key, value in mesh_grid.items()}
             freq_scaling = freq_scaling_func(freqs, **grid_spectrals)
-            integrals[i, j] = np.trapz(freq_scaling * weights, freqs)
+            integrals[i, j] = np.trapz(freq_scaling.value * weights_value, freqs_value)
     integrals = np.transpose(integrals)
 
     scaling = []
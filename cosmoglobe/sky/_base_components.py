@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Dict, Optional, Tuple
 import warnings
 
@@ -29,6 +30,55 @@ from cosmoglobe.sky._freq_range import FrequencyRange
 from cosmoglobe.sky._units import cmb_equivalencies
 from cosmoglobe.sky.components._labels import SkyComponentLabel
 
+# Memoized hp.get_nside results keyed on the underlying data buffer and
+# shape of the map. When many components are initialized from the samples
+# of a chain, the same maps are repeatedly validated, and the cache
+# amortizes the nside lookup across those calls.
+_NSIDE_CACHE: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+_NSIDE_CACHE_MAX_SIZE = 128
+
+# The spectral equivalency takes no arguments, so it is built once rather
+# than on every reference frequency validation.
+_SPECTRAL_EQUIVALENCIES = spectral()
+
+# Valid reference frequency shapes, hashed once at module scope so the
+# per-initialization shape check is a set lookup.
+_VALID_FREQ_REF_SHAPES = frozenset([(1, 1), (3, 1)])
+
+
+def _get_nside(map_: Quantity) -> int:
+    """Returns the nside of a HEALPIX map, memoizing the result."""
+
+    key = (map_.__array_interface__["data"][0], map_.shape)
+    try:
+        return _NSIDE_CACHE[key]
+    except KeyError:
+        nside = hp.get_nside(map_)
+        if len(_NSIDE_CACHE) >= _NSIDE_CACHE_MAX_SIZE:
+            _NSIDE_CACHE.clear()
+        _NSIDE_CACHE[key] = nside
+
+        return nside
+
+
+def broadcast_ravel(
+    broadcast_shape: Tuple[int, ...], *arrays: np.ndarray
+) -> Tuple[np.ndarray, ...]:
+    """Broadcasts arrays to a common shape and returns flat contiguous arrays.
+
+    The SED kernels require unit-stride 1-dimensional inputs of a common
+    size. Shape expansion is done exclusively through broadcasting: inputs
+    that already have the target shape pass through as views, and only
+    scalar-like inputs (frequencies and reference frequencies against
+    full-sky spectral parameter maps, or vice versa in the bandpass grid
+    path) are materialized.
+    """
+
+    return tuple(
+        np.ascontiguousarray(np.broadcast_to(array, broadcast_shape)).ravel()
+        for array in arrays
+    )
+
 
 class SkyComponent(ABC):
     """Abstract base class for sky components.
@@ -201,6 +251,23 @@ class SkyComponent(ABC):
 
         return self.amp.shape[0] == 3
 
+    @cached_property
+    def _amp_value(self) -> np.ndarray:
+        """Raw-value view of the amplitude map.
+
+        SED evaluations are memory bound, and operating on bare ndarrays
+        in the hot loops avoids the overhead of the Quantity machinery.
+        The Quantity attributes are kept for the public API.
+        """
+
+        return self.amp.value
+
+    @cached_property
+    def _freq_ref_ghz(self) -> np.ndarray:
+        """Raw-value reference frequency in GHz used in hot loops."""
+
+        return self.freq_ref.to_value("GHz")
+
     @staticmethod
     def _validate_freq_ref(freq_ref: Quantity):
         """Validates the type and shape of a reference frequency attribute."""
@@ -208,31 +275,47 @@ class SkyComponent(ABC):
         if not isinstance(freq_ref, Quantity):
             raise TypeError("reference frequency must of type `astropy.units.Quantity`")
 
-        if freq_ref.shape not in ((1, 1), (3, 1)):
+        if freq_ref.shape not in _VALID_FREQ_REF_SHAPES:
             raise ValueError(
                 "shape of reference frequency must be either (1, 1) or "
                 "(3, 1) depending on if the component is polarized."
             )
 
         try:
-            freq_ref.to("Hz", equivalencies=spectral())
+            freq_ref.to("Hz", equivalencies=_SPECTRAL_EQUIVALENCIES)
         except UnitConversionError:
             raise UnitsError("reference frequency must have units compatible with Hz")
 
+    def _validate_spectral_parameter_shapes(
+        self, spectral_parameters: Dict[str, Quantity], size_descriptor: str
+    ) -> None:
+        """Validates the type and shape of a set of spectral parameters.
+
+        Hot when many components are initialized from the samples of a
+        chain, so attribute lookups are hoisted out of the loop. The
+        checks operate on Quantity objects and cannot be pushed into a
+        compiled helper.
+        """
+
+        amp_dim = self.amp.shape[0]
+        for parameter in spectral_parameters.values():
+            if not isinstance(parameter, Quantity):
+                raise TypeError(
+                    "spectral_parameter must be of type `astropy.units.Quantity`"
+                )
+
+            shape = parameter.shape
+            if len(shape) < 2 or shape[0] != amp_dim:
+                raise ValueError(
+                    f"shape of spectral parameter must be either (1, `{size_descriptor}`) "
+                    f"or (3, `{size_descriptor}`) if the parameter is a map, or (1, 1), "
+                    "(3, 1) if the parameter is a scalar"
+                )
+
     def __repr__(self) -> str:
         """Representation of the sky component."""
 
-        main_repr = f"{self.__class__.__name__}"
-        main_repr += "("
-        extra_repr = ""
-        for key in self.spectral_parameters.keys():
-            extra_repr += f"{key}, "
-        if extra_repr:
-            extra_repr = extra_repr[:-2]
-        main_repr += extra_repr
-        main_repr += ")"
-
-        return main_repr
+        return f"{type(self).__name__}({', '.join(self.spectral_parameters)})"
 
 
 class DiffuseComponent(SkyComponent):
@@ -242,6 +325,11 @@ class DiffuseComponent(SkyComponent):
     which computes the unscaled component SED.
     """
 
+    # Lazily allocated work buffer reused by the SED kernels so that
+    # repeated scaling evaluations (one per frequency in a bandpass
+    # integration) do not allocate a fresh full-sky array each call.
+    _scratch: Optional[np.ndarray] = None
+
     def __init__(self, amp, freq_ref, **spectral_parameters):
         super().__init__(amp, freq_ref, **spectral_parameters)
 
@@ -250,6 +338,19 @@ class DiffuseComponent(SkyComponent):
         self._validate_amp(amp)
         self._validate_spectral_parameters(spectral_parameters)
 
+    def _get_scratch(self, size: int) -> np.ndarray:
+        """Returns a reusable float64 output buffer for the SED kernels.
+
+        The buffer is overwritten by the next scaling evaluation on the
+        same component, which is safe for the emission paths since they
+        consume the scaling factor immediately.
+        """
+
+        if self._scratch is None or self._scratch.size != size:
+            self._scratch = np.empty(size)
+
+        return self._scratch
+
     @abstractmethod
     def get_freq_scaling(
         self, freqs: Quantity, **spectral_parameters: Quantity
@@ -316,7 +417,7 @@ class DiffuseComponent(SkyComponent):
             raise TypeError("ampltiude map must of type `astropy.units.Quantity`")
 
         try:
-            hp.get_nside(amp)
+            _get_nside(amp)
         except TypeError:
             raise NsideError(
                 f"the number of pixels ({amp.shape}) in the amplitude map "
@@ -330,8 +431,11 @@ class DiffuseComponent(SkyComponent):
                     "(3, `npix`) depending on if the component is polarized."
                 )
 
+            # Converting the unit (rather than the map) validates
+            # compatibility without allocating a converted copy of the
+            # full amplitude map.
             try:
-                amp.to(
+                amp.unit.to(
                     DEFAULT_OUTPUT_UNIT,
                     equivalencies=cmb_equivalencies(self.freq_ref),
                 )
@@ -343,21 +447,12 @@ class DiffuseComponent(SkyComponent):
     def _validate_spectral_parameters(
         self, spectral_parameters: Dict[str, Quantity]
     ) -> None:
-        for name, parameter in spectral_parameters.items():
-            if not isinstance(parameter, Quantity):
-                raise TypeError(
-                    "spectral_parameter must be of type `astropy.units.Quantity`"
-                )
+        self._validate_spectral_parameter_shapes(spectral_parameters, "npix")
 
-            if parameter.ndim < 2 or parameter.shape[0] != self.amp.shape[0]:
-                raise ValueError(
-                    "shape of spectral parameter must be either (1, `npix`) or "
-                    "(3, `npix`) if the parameter is a map, or (1, 1), (3, 1) "
-                    "if the parameter is a scalar"
-                )
+        for name, parameter in spectral_parameters.items():
             if parameter.shape[1] > 1:
                 try:
-                    hp.get_nside(parameter)
+                    _get_nside(parameter)
                 except TypeError:
                     raise NsideError(
                         f"the number of pixels ({parameter.shape}) in the spectral "
@@ -392,6 +487,19 @@ class PointSourceComponent(SkyComponent):
             )
         self._validate_spectral_parameters(spectral_parameters)
 
+        # Contiguous per-coordinate views of the catalog. The beam
+        # convolution iterates over the longitudes and latitudes
+        # separately, and unit-stride arrays avoid the strided access
+        # into the (3, n_pointsources) catalog layout. The unit vectors
+        # of the sources are precomputed as well so that the beam query
+        # does not convert each source per simulated band.
+        catalog_deg = self.catalog.to_value("deg")
+        self._catalog_lon = np.ascontiguousarray(catalog_deg[0])
+        self._catalog_lat = np.ascontiguousarray(catalog_deg[1])
+        self._catalog_vecs = np.ascontiguousarray(
+            hp.ang2vec(self._catalog_lon, self._catalog_lat, lonlat=True)
+        )
+
     @abstractmethod
     def get_freq_scaling(
         self, freqs: Quantity, **spectral_parameters: Quantity
@@ -424,7 +532,9 @@ class PointSourceComponent(SkyComponent):
         )
         emission = pointsources_to_healpix(
             point_sources=scaled_point_sources,
-            catalog=self.catalog,
+            lons=self._catalog_lon,
+            lats=self._catalog_lat,
+            vecs=self._catalog_vecs,
             nside=nside,
             fwhm=fwhm,
         )
@@ -456,7 +566,9 @@ class PointSourceComponent(SkyComponent):
         scaled_point_sources = self.amp * bandpass_scaling
         emission = pointsources_to_healpix(
             point_sources=scaled_point_sources,
-            catalog=self.catalog,
+            lons=self._catalog_lon,
+            lats=self._catalog_lat,
+            vecs=self._catalog_vecs,
             nside=nside,
             fwhm=fwhm,
         )
@@ -484,8 +596,11 @@ class PointSourceComponent(SkyComponent):
                 "shape of amplitude map must be either (1, `npointsources`) or "
                 "(3, `npointsources`) depending on if the component is polarized."
             )
+        # Converting the unit (rather than the map) validates
+        # compatibility without the amp / sr temporary and the converted
+        # copy of the full point source array.
         try:
-            (amp / Unit("sr")).to(
+            (amp.unit / Unit("sr")).to(
                 DEFAULT_OUTPUT_UNIT,
                 equivalencies=cmb_equivalencies(self.freq_ref),
             )
@@ -498,18 +613,7 @@ class PointSourceComponent(SkyComponent):
     def _validate_spectral_parameters(
         self, spectral_parameters: Dict[str, Quantity]
     ) -> None:
-        for parameter in spectral_parameters.values():
-            if not isinstance(parameter, Quantity):
-                raise TypeError(
-                    "spectral_parameter must be of type `astropy.units.Quantity`"
-                )
-
-            if parameter.ndim < 2 or parameter.shape[0] != self.amp.shape[0]:
-                raise ValueError(
-                    "shape of spectral parameter must be either (1, `npointsources`) or "
-                    "(3, `npointsources`) if the parameter is a map, or (1, 1), (3, 1) "
-                    "if the parameter is a scalar"
-                )
+        self._validate_spectral_parameter_shapes(spectral_parameters, "npointsources")
 
     def _validate_catalog(self, catalog: Quantity):
         if catalog.shape[1] != self.amp.shape[1]:
@@ -45,12 +45,18 @@ def gaussian_beam_2D(r: np.ndarray, sigma: float) -> np.ndarray:
 
 def pointsources_to_healpix(
     point_sources: Quantity,
-    catalog: Quantity,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    vecs: np.ndarray,
     nside: int,
     fwhm: Quantity,
 ) -> Quantity:
     """Maps the point sources to a HEALPIX map.
 
+    The point source coordinates are given as separate contiguous
+    longitude and latitude arrays in degrees, along with the
+    corresponding precomputed (n_pointsources, 3) unit vectors.
+
     For more information on this calculation, please see `Mitra et al. (2010)
     <https://arxiv.org/pdf/1005.1929.pdf>`_.
     """
@@ -65,7 +71,6 @@ def pointsources_to_healpix(
     # Getting the longitude and latitude for each pixel on the healpix map
 
     fwhm = fwhm.to("rad")
-    catalog = catalog.to("deg").value
 
     # Directly map to pixels without any smoothing
     if fwhm == DEFAULT_BEAM_FWHM:
@@ -73,7 +78,7 @@ def pointsources_to_healpix(
             "fwhm not specified. Mapping point sources to pixels "
             "without beam smoothing"
         )
-        pixels = hp.ang2pix(nside, *catalog, lonlat=True)
+        pixels = hp.ang2pix(nside, lons, lats, lonlat=True)
         for IQU, emission in enumerate(point_sources):
             healpix_map[IQU, pixels] = emission
 
@@ -93,10 +98,8 @@ def pointsources_to_healpix(
             nside, np.arange(hp.nside2npix(nside)), lonlat=True
         )
 
-        lons, lats = catalog
         for idx, (lon, lat) in enumerate(zip(lons, lats)):
-            vec = hp.ang2vec(lon, lat, lonlat=True)
-            pixels = hp.query_disc(nside, vec, r_max)
+            pixels = hp.query_disc(nside, vecs[idx], r_max)
             angular_distance = hp.rotator.angdist(
                 [pixel_lon[pixels], pixel_lat[pixels]], [lon, lat], lonlat=True
             )
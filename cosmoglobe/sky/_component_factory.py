@@ -179,9 +179,7 @@ def get_comp_from_chain(
 
         args[arg] = Quantity(value, unit=units[arg] if arg in units else None)
 
-    functions = chain_context_registry.get_functions(component_class)
-    for function in functions:
-        args.update(function(args))
+    args = chain_context_registry.get_context_pipeline(component_class)(args)
 
     return component_class(**args)
 
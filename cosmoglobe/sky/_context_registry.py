@@ -1,13 +1,27 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Type, TYPE_CHECKING
+from typing import Dict, List, Optional, Protocol, Type
 
-from astropy.units import Unit
+from astropy.units import Quantity, Unit
 
 from cosmoglobe.sky._base_components import SkyComponent
 
-if TYPE_CHECKING:
-    from cosmoglobe.sky._chain_context import ChainContext
+
+class ChainContext(Protocol):
+    """Protocol defining the interface for a chain context.
+
+    Chain context defines additional processing required on the chain items
+    before they are ready to be put into the sky model.
+
+    A context needs to manipulate and return the `args` dictionary.
+
+    NOTE: Context functions are executed *AFTER* renaming the units in the
+    chain. It is therefore important to use keys to the args dict that match
+    the registered naming mappings.
+    """
+
+    def __call__(self, args: Dict[str, Quantity]) -> Dict[str, Quantity]:
+        ...
 
 
 @dataclass
@@ -17,6 +31,7 @@ class ChainContextRegistry:
     functions: Dict[Type[SkyComponent], List[ChainContext]] = field(default_factory=dict)
     mappings: Dict[Type[SkyComponent], Dict[str, str]] = field(default_factory=dict)
     units: Dict[Type[SkyComponent], Dict[str, Unit]] = field(default_factory=dict)
+    pipelines: Dict[Type[SkyComponent], ChainContext] = field(default_factory=dict)
 
     def register_class_context(
         self,
@@ -32,6 +47,7 @@ class ChainContextRegistry:
                 if sky_component_class not in self.functions:
                     self.functions[sky_component_class] = []
                 self.functions[sky_component_class].append(context)
+            self.pipelines.pop(sky_component_class, None)
 
         if mappings is not None:
             if sky_component_class not in self.mappings:
@@ -53,6 +69,33 @@ class ChainContextRegistry:
 
         return [context for context in self.functions[sky_component_class]]
 
+    def get_context_pipeline(
+        self, sky_component_class: Type[SkyComponent]
+    ) -> ChainContext:
+        """Returns a single callable applying all contexts for a component.
+
+        The pipeline is composed once per component class and cached, so
+        the per-sample hot path is one dict lookup and a tight chain of
+        calls instead of iterating the registry.
+        """
+
+        if sky_component_class not in self.functions:
+            raise KeyError(f"No context is registered for class {sky_component_class=}")
+
+        try:
+            return self.pipelines[sky_component_class]
+        except KeyError:
+            contexts = tuple(self.functions[sky_component_class])
+
+            def pipeline(args):
+                for context in contexts:
+                    args.update(context(args))
+                return args
+
+            self.pipelines[sky_component_class] = pipeline
+
+            return pipeline
+
     def get_parameter_mappings(
         self, sky_component_class: Type[SkyComponent]
     ) -> Dict[str, str]:
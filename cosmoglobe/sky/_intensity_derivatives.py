@@ -5,6 +5,10 @@ import numpy as np
 
 import cosmoglobe.sky._constants as const
 
+# h / (k_B T_0) folded to a single raw factor so the blackbody argument
+# x = h freq / (k_B T_0) is one multiply per frequency.
+_H_OVER_K_T0_HZ = (const.h / (const.k_B * const.T_0)).to_value("1 / Hz")
+
 
 class IntensityDerivative(Protocol):
     """Protocol defining the interface for an intensity derivate."""
@@ -35,9 +39,16 @@ def bnu_prime_RJ(freqs: Quantity) -> Quantity:
 def bnu_prime_CMB(freqs: Quantity) -> Quantity:
     """Intensity derivative for K_CMB (dB_nu(T)/dT)."""
 
-    x = (const.h * freqs) / (const.k_B * const.T_0)
+    # The Planck correction x^2 exp(x) / expm1(x)^2 is evaluated on raw
+    # values with exp(x) rewritten as expm1(x) + 1, saving a
+    # transcendental and the Quantity temporaries of the fully unitful
+    # expression.
+    x = freqs.to_value("Hz") * _H_OVER_K_T0_HZ
+    expm1_x = np.expm1(x)
+    planck_correction = x ** 2 * (expm1_x + 1.0) / (expm1_x * expm1_x)
+
     A = 2 * const.k_B * freqs ** 2 / const.c ** 2
-    factor = A * x ** 2 * np.exp(x) / np.expm1(x) ** 2
+    factor = A * planck_correction
     factor *= Unit("K") / (Unit("K_CMB") * Unit("sr"))
 
     return factor
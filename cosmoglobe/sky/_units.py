@@ -5,7 +5,8 @@ them our selves. In the following code, we follow the implementation in pysm3
 Reference: https://github.com/galsci/pysm/blob/main/pysm3/__init__.py
 """
 
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, List, Tuple
 
 from astropy.units import (
     add_enabled_units,
@@ -16,18 +17,39 @@ from astropy.units import (
     thermodynamic_temperature,
     Unit,
 )
+import numpy as np
 
 
 @quantity_input(freqs="Hz")
 def cmb_equivalencies(freqs: Quantity) -> List[Any]:
     """Custom equivalency representing the conversion between Kelvin Rayleigh-Jeans and CMB units.
 
+    The equivalency list is memoized; building it requires constructing
+    the brightness and thermodynamic temperature equivalencies, which is
+    pure overhead when the same frequencies are used repeatedly, such as
+    when validating many components against a common reference frequency.
+
     Parameters
     ----------
     freqs
         Frequencies at which to perform the conversion.
     """
 
+    return _cmb_equivalencies_cached(
+        freqs.value.tobytes(), freqs.shape, freqs.dtype.str, freqs.unit.to_string()
+    )
+
+
+@lru_cache(maxsize=256)
+def _cmb_equivalencies_cached(
+    freq_bytes: bytes, shape: Tuple[int, ...], dtype: str, unit: str
+) -> List[Any]:
+    """Builds the cmb equivalency list from a hashable key."""
+
+    freqs = Quantity(
+        np.frombuffer(freq_bytes, dtype=dtype).reshape(shape), unit=unit
+    )
+
     [(_, _, Jy_to_CMB, CMB_to_Jy)] = thermodynamic_temperature(freqs)
     [(_, _, Jy_to_RJ, RJ_to_Jy)] = brightness_temperature(freqs)
 
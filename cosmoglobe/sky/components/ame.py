@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple
 
 from astropy.units import Quantity, Unit
@@ -11,10 +12,31 @@ from cosmoglobe.sky.components._labels import SkyComponentLabel
 SPDUST2_FILE = DATA_DIR / "spdust2_cnm.dat"
 
 SPDUST2_FREQS, SPDUST2_AMPS = np.loadtxt(SPDUST2_FILE, unpack=True)
-SPDUST2_FREQS *= Unit("GHz")
-SPDUST2_AMPS *= Unit("Jy/sr")
+# loadtxt with unpack=True hands back rows of the transposed table, which
+# are strided views; np.interp would otherwise copy them on every call.
+SPDUST2_FREQS = np.ascontiguousarray(SPDUST2_FREQS) * Unit("GHz")
+SPDUST2_AMPS = np.ascontiguousarray(SPDUST2_AMPS) * Unit("Jy/sr")
 SPDUST2_TEMPLATE = (SPDUST2_FREQS, SPDUST2_AMPS)
 
+# Raw-value template frequency axis used by the interpolation hot path.
+_SPDUST2_FREQS_GHZ = SPDUST2_FREQS.to_value("GHz")
+
+
+@lru_cache(maxsize=4)
+def _get_spdust2_amps(unit: str) -> np.ndarray:
+    """Returns the template amplitudes converted to a given unit, memoized.
+
+    The conversion only depends on the amplitude unit, so components
+    recreated per chain sample share the converted template.
+    """
+
+    return np.ascontiguousarray(
+        SPDUST2_TEMPLATE[1]
+        .to(Unit(unit), equivalencies=cmb_equivalencies(SPDUST2_TEMPLATE[0]))
+        .decompose()
+        .value
+    )
+
 
 class SpinningDust(DiffuseComponent):
     r"""Class representing the AME component in the Cosmoglobe Sky Model.
@@ -43,25 +65,27 @@ class SpinningDust(DiffuseComponent):
     def get_freq_scaling(self, freqs: Quantity, freq_peak: Quantity) -> Quantity:
         """See base class."""
 
-        spdust2_freqs = SPDUST2_TEMPLATE[0]
-        # We set the spdust2 template amplitudes to the component amplitude units.
-        spdust2_amps = SPDUST2_TEMPLATE[1].to(
-            self.amp.unit, equivalencies=cmb_equivalencies(spdust2_freqs)
-        )
+        spdust2_amps = _get_spdust2_amps(self.amp.unit.to_string())
 
-        peak_scale = 30 * Unit("GHz") / freq_peak
-        interp = np.interp(
-            (freqs * peak_scale).si.value,
-            spdust2_freqs.si.value,
-            spdust2_amps.decompose().value,
-            left=0.0,
-            right=0.0,
-        )
-        interp_ref = np.interp(
-            (self.freq_ref * peak_scale).si.value,
-            spdust2_freqs.si.value,
-            spdust2_amps.decompose().value,
+        # The scaled frequencies are computed on raw GHz values to avoid
+        # Quantity temporaries for every interpolation query.
+        peak_scale = 30.0 / freq_peak.to_value("GHz")
+        freqs_scaled = np.asarray(freqs.to_value("GHz") * peak_scale)
+        freq_ref_scaled = np.asarray(self._freq_ref_ghz * peak_scale)
+
+        # Both the frequency and reference queries are interpolated in a
+        # single call so the template is only traversed once.
+        queries = np.concatenate([freqs_scaled.ravel(), freq_ref_scaled.ravel()])
+        interpolated = np.interp(queries, _SPDUST2_FREQS_GHZ, spdust2_amps)
+        interp = interpolated[: freqs_scaled.size].reshape(freqs_scaled.shape)
+        interp_ref = interpolated[freqs_scaled.size :].reshape(freq_ref_scaled.shape)
+
+        # Frequencies outside the template carry no spinning dust emission.
+        out_of_range = (freqs_scaled < _SPDUST2_FREQS_GHZ[0]) | (
+            freqs_scaled > _SPDUST2_FREQS_GHZ[-1]
         )
+        if out_of_range.any():
+            interp = np.where(out_of_range, 0.0, interp)
 
         scaling = interp / interp_ref
 
@@ -1,10 +1,15 @@
 from astropy.units import Quantity, Unit, quantity_input
+from numba import njit, prange
 import numpy as np
 
-from cosmoglobe.sky._base_components import DiffuseComponent
+from cosmoglobe.sky._base_components import DiffuseComponent, broadcast_ravel
 from cosmoglobe.sky.components._labels import SkyComponentLabel
 import cosmoglobe.sky._constants as const
 
+# h/k_B expressed so that freq [GHz] / T [K] gives the dimensionless
+# blackbody argument h freq / (k_B T).
+_H_OVER_K_GHZ = (const.h / const.k_B).to_value("K / GHz")
+
 
 class ModifiedBlackbody(DiffuseComponent):
     r"""Class representing the thermal dust component in the Cosmoglobe Sky Model.
@@ -39,12 +44,49 @@ class ModifiedBlackbody(DiffuseComponent):
     ) -> Quantity:
         """See base class."""
 
-        blackbody_ratio = blackbody_emission(freqs, T) / blackbody_emission(
-            self.freq_ref, T
+        # The blackbody ratio collapses analytically to
+        # (freq/freq_ref)^3 expm1(x_ref)/expm1(x), which combined with the
+        # power law gives a single fused expression on raw values instead
+        # of two blackbody evaluations and their full-sky temporaries.
+        beta_value = np.asarray(beta.value, dtype=np.float64)
+        T_K = np.asarray(T.to_value("K"), dtype=np.float64)
+
+        broadcast_shape = np.broadcast_shapes(
+            freqs.shape, self._freq_ref_ghz.shape, beta_value.shape, T_K.shape
+        )
+        freqs_ghz, freq_ref_ghz, beta_value, T_K = broadcast_ravel(
+            broadcast_shape, freqs.to_value("GHz"), self._freq_ref_ghz, beta_value, T_K
         )
-        scaling = (freqs / self.freq_ref) ** (beta - 2) * blackbody_ratio
+        scaling = _mbb_scaling(
+            freqs_ghz, freq_ref_ghz, beta_value, T_K, self._get_scratch(T_K.size)
+        )
+
+        return Quantity(scaling.reshape(broadcast_shape), copy=False)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mbb_scaling(
+    freqs: np.ndarray,
+    freq_ref: np.ndarray,
+    beta: np.ndarray,
+    T: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Returns the fused modified blackbody SED scaling factor.
+
+    Evaluates (freq/freq_ref)^(beta + 1) expm1(x_ref)/expm1(x) in a
+    single parallel pass over the pixels, writing into `out`. All inputs
+    must be 1-dimensional arrays of a common size with frequencies in
+    GHz and temperatures in K.
+    """
+
+    for pixel in prange(T.size):
+        x = _H_OVER_K_GHZ * freqs[pixel] / T[pixel]
+        x_ref = _H_OVER_K_GHZ * freq_ref[pixel] / T[pixel]
+        ratio = freqs[pixel] / freq_ref[pixel]
+        out[pixel] = ratio ** (beta[pixel] + 1) * np.expm1(x_ref) / np.expm1(x)
 
-        return scaling
+    return out
 
 
 @quantity_input(freq="Hz", T="K")
@@ -68,7 +110,7 @@ def blackbody_emission(freq: Quantity, T: Quantity) -> Quantity:
     """
 
     # Avoiding overflow and underflow.
-    T = T.astype(np.float64)
+    T = T.astype(np.float64, copy=False)
 
     term1 = (2 * const.h * freq ** 3) / const.c ** 2
     term2 = np.expm1((const.h * freq) / (const.k_B * T))
@@ -1,9 +1,25 @@
+from typing import Optional
+
 from astropy.units import Quantity, Unit, quantity_input
+from numba import njit, prange
 import numpy as np
 
-from cosmoglobe.sky._base_components import DiffuseComponent
+from cosmoglobe.sky._base_components import DiffuseComponent, broadcast_ravel
 from cosmoglobe.sky.components._labels import SkyComponentLabel
 
+SQRT3_OVER_PI = np.sqrt(3) / np.pi
+
+# The Gaunt factor is a smooth function of log(freq) and log(T_e). Rather
+# than evaluating the analytical expression per pixel on every call, we
+# tabulate it once on a log-log grid covering the Commander operating range
+# and sample the table with bilinear interpolation. Out-of-range inputs
+# fall back to the analytical expression.
+_GAUNT_TABLE_N = 256
+_GAUNT_LOG_FREQ = np.linspace(np.log(0.1), np.log(3000.0), _GAUNT_TABLE_N)  # GHz
+_GAUNT_LOG_T_E = np.linspace(np.log(100.0), np.log(1e6), _GAUNT_TABLE_N)  # K
+_GAUNT_LOG_FREQ_STEP = _GAUNT_LOG_FREQ[1] - _GAUNT_LOG_FREQ[0]
+_GAUNT_LOG_T_E_STEP = _GAUNT_LOG_T_E[1] - _GAUNT_LOG_T_E[0]
+
 
 class LinearOpticallyThin(DiffuseComponent):
     r"""Class representing the free-free component in the Cosmoglobe Sky Model.
@@ -27,13 +43,150 @@ class LinearOpticallyThin(DiffuseComponent):
     label = SkyComponentLabel.FF
     freq_range = (0 * Unit("Hz"), 5 * Unit("THz"))
 
+    # Lazily cached electron-temperature-only quantities for the
+    # temperature map of the component: the raw float64 values in K and
+    # freq_ref**2 / gaunt_factor(freq_ref, T_e). Both are constant over
+    # frequencies and would otherwise be recomputed for every frequency
+    # in a bandpass integration.
+    _T_e_K: Optional[np.ndarray] = None
+    _ref_factor: Optional[np.ndarray] = None
+
     def get_freq_scaling(self, freqs: Quantity, T_e: Quantity) -> Quantity:
         """See base class."""
 
-        gaunt_factor_ratio = gaunt_factor(freqs, T_e) / gaunt_factor(self.freq_ref, T_e)
-        scaling = (self.freq_ref / freqs) ** 2 * gaunt_factor_ratio
+        if T_e is self.spectral_parameters["T_e"]:
+            if self._ref_factor is None:
+                self._T_e_K = np.asarray(T_e.to_value("K"), dtype=np.float64)
+                self._ref_factor = self._get_ref_factor(self._T_e_K)
+            T_e_K = self._T_e_K
+            ref_factor = self._ref_factor
+        else:
+            # Bandpass integrations call this function with gridded
+            # electron temperatures for which we cannot reuse the cache.
+            T_e_K = np.asarray(T_e.to_value("K"), dtype=np.float64)
+            ref_factor = self._get_ref_factor(T_e_K)
+
+        broadcast_shape = np.broadcast_shapes(
+            freqs.shape, ref_factor.shape, T_e_K.shape
+        )
+        freqs_ghz, ref_factor, T_e_K = broadcast_ravel(
+            broadcast_shape, freqs.to_value("GHz"), ref_factor, T_e_K
+        )
+        scaling = _freefree_scaling(
+            freqs_ghz, T_e_K, ref_factor, _GAUNT_TABLE, self._get_scratch(T_e_K.size)
+        )
+
+        return Quantity(scaling.reshape(broadcast_shape), copy=False)
+
+    def _get_ref_factor(self, T_e_K: np.ndarray) -> np.ndarray:
+        """Returns freq_ref**2 / gaunt_factor(freq_ref, T_e) [GHz^2]."""
+
+        freq_ref_ghz = self._freq_ref_ghz
+
+        return freq_ref_ghz ** 2 / _gaunt_factor_table(freq_ref_ghz, T_e_K)
+
+
+def _gaunt_factor_analytical(freq: np.ndarray, T_e: np.ndarray) -> np.ndarray:
+    """Returns the analytical Gaunt factor.
+
+    Parameters
+    ----------
+    freq
+        Frequency [GHz].
+    T_e
+        Electron temperature [K].
+
+    Returns
+    -------
+        Gaunt factor.
+    """
+
+    # log(exp(x) + e) written as logaddexp(x, 1) to avoid the exp/log
+    # round-trip and its overflow potential. x**-1.5 is written as
+    # 1 / (x * sqrt(x)) since a sqrt and a multiply are far cheaper than
+    # a libm pow call with a float exponent.
+    x = T_e * 1e-4
+    inv_x15 = 1.0 / (x * np.sqrt(x))
+
+    return np.logaddexp(5.96 - SQRT3_OVER_PI * np.log(freq * inv_x15), 1.0)
+
+
+_GAUNT_TABLE = _gaunt_factor_analytical(
+    np.exp(_GAUNT_LOG_FREQ)[:, np.newaxis], np.exp(_GAUNT_LOG_T_E)
+)
+
+
+@njit(cache=True)
+def _gaunt_factor_pixel(freq: float, T_e: float, table: np.ndarray) -> float:
+    """Samples the tabulated Gaunt factor for a single pixel.
+
+    Performs bilinear interpolation in the log-log table, falling back to
+    the analytical expression when the pixel is outside the tabulated
+    range. Frequencies are in GHz and electron temperatures in K.
+    """
+
+    x = (np.log(freq) - _GAUNT_LOG_FREQ[0]) / _GAUNT_LOG_FREQ_STEP
+    y = (np.log(T_e) - _GAUNT_LOG_T_E[0]) / _GAUNT_LOG_T_E_STEP
+    if 0 <= x <= _GAUNT_TABLE_N - 1 and 0 <= y <= _GAUNT_TABLE_N - 1:
+        col = min(int(x), _GAUNT_TABLE_N - 2)
+        row = min(int(y), _GAUNT_TABLE_N - 2)
+        frac_x = x - col
+        frac_y = y - row
+
+        return (
+            table[col, row] * (1 - frac_x) * (1 - frac_y)
+            + table[col + 1, row] * frac_x * (1 - frac_y)
+            + table[col, row + 1] * (1 - frac_x) * frac_y
+            + table[col + 1, row + 1] * frac_x * frac_y
+        )
+
+    x = T_e * 1e-4
+    inv_x15 = 1.0 / (x * np.sqrt(x))
 
-        return scaling
+    return np.logaddexp(5.96 - SQRT3_OVER_PI * np.log(freq * inv_x15), 1.0)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _freefree_scaling(
+    freqs: np.ndarray,
+    T_e: np.ndarray,
+    ref_factor: np.ndarray,
+    table: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Returns the fused free-free SED scaling factor.
+
+    Computes the Gaunt factor and the squared frequency ratio in a single
+    pass over the pixels, avoiding the temporary arrays that separate
+    `gaunt_factor` calls would allocate. The reference frequency part of
+    the scaling is precomputed and passed in through `ref_factor`. All
+    inputs must be 1-dimensional arrays of a common size with frequencies
+    in GHz and electron temperatures in K.
+
+    Parameters
+    ----------
+    freqs
+        Frequencies [GHz].
+    T_e
+        Electron temperatures [K].
+    ref_factor
+        Precomputed freq_ref**2 / gaunt_factor(freq_ref, T_e) [GHz^2].
+    table
+        Tabulated Gaunt factor on the log-log grid.
+    out
+        Output buffer of the common input size.
+
+    Returns
+    -------
+    out
+        Free-free scaling factor.
+    """
+
+    for pixel in prange(T_e.size):
+        gaunt = _gaunt_factor_pixel(freqs[pixel], T_e[pixel], table)
+        out[pixel] = gaunt * ref_factor[pixel] / freqs[pixel] ** 2
+
+    return out
 
 
 @quantity_input(freq="Hz", T_e="K")
@@ -41,7 +194,8 @@ def gaunt_factor(freq: Quantity, T_e: Quantity) -> Quantity:
     """Returns the Gaunt factor.
 
     Computes the gaunt factor for a given frequency and electron
-    temperaturein SI units.
+    temperaturein SI units. The value is sampled from the precomputed
+    log-log table when in range, and computed analytically otherwise.
 
     Parameters
     ----------
@@ -57,12 +211,51 @@ def gaunt_factor(freq: Quantity, T_e: Quantity) -> Quantity:
     """
 
     # Avoiding overflow and underflow.
-    T_e = T_e.astype(np.float64)
-    T_e = (T_e.to("kK")).value / 10
+    T_e = T_e.astype(np.float64, copy=False)
+    T_e = (T_e.to("K")).value
     freq = (freq.to("GHz")).value
 
-    gaunt_factor = np.log(
-        np.exp(5.96 - (np.sqrt(3) / np.pi) * np.log(freq * T_e ** -1.5)) + np.e
+    return Quantity(_gaunt_factor_table(freq, T_e))
+
+
+def _gaunt_factor_table(freq: np.ndarray, T_e: np.ndarray) -> np.ndarray:
+    """Samples the tabulated Gaunt factor.
+
+    Performs bilinear interpolation in the log-log table, falling back to
+    the analytical expression for inputs outside the tabulated range.
+
+    Parameters
+    ----------
+    freq
+        Frequency [GHz].
+    T_e
+        Electron temperature [K].
+
+    Returns
+    -------
+        Gaunt factor.
+    """
+
+    freq, T_e = np.broadcast_arrays(np.asarray(freq, dtype=np.float64), T_e)
+
+    x = (np.log(freq) - _GAUNT_LOG_FREQ[0]) / _GAUNT_LOG_FREQ_STEP
+    y = (np.log(T_e) - _GAUNT_LOG_T_E[0]) / _GAUNT_LOG_T_E_STEP
+    in_range = (
+        (x >= 0) & (x <= _GAUNT_TABLE_N - 1) & (y >= 0) & (y <= _GAUNT_TABLE_N - 1)
+    )
+
+    col = np.minimum(np.clip(x, 0, None).astype(np.intp), _GAUNT_TABLE_N - 2)
+    row = np.minimum(np.clip(y, 0, None).astype(np.intp), _GAUNT_TABLE_N - 2)
+    frac_x = np.clip(x - col, 0, 1)
+    frac_y = np.clip(y - row, 0, 1)
+
+    gaunt = (
+        _GAUNT_TABLE[col, row] * (1 - frac_x) * (1 - frac_y)
+        + _GAUNT_TABLE[col + 1, row] * frac_x * (1 - frac_y)
+        + _GAUNT_TABLE[col, row + 1] * (1 - frac_x) * frac_y
+        + _GAUNT_TABLE[col + 1, row + 1] * frac_x * frac_y
     )
+    if not in_range.all():
+        gaunt = np.where(in_range, gaunt, _gaunt_factor_analytical(freq, T_e))
 
-    return Quantity(gaunt_factor)
+    return gaunt
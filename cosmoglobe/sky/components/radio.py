@@ -37,6 +37,9 @@ class AGNPowerLaw(PointSourceComponent):
     def get_freq_scaling(self, freqs: Quantity, alpha: Quantity) -> Quantity:
         """See base class."""
 
-        scaling = (freqs / self.freq_ref) ** (alpha - 2)
+        # The frequency ratio is scalar-like while alpha is a per-source
+        # array; working on raw values leaves a single pow over alpha
+        # instead of unit-checked Quantity arithmetic per operation.
+        ratio = freqs.to_value("GHz") / self._freq_ref_ghz
 
-        return scaling
+        return Quantity(np.power(ratio, alpha.value - 2))
@@ -1,6 +1,8 @@
 from astropy.units import Quantity, Unit
+from numba import njit, prange
+import numpy as np
 
-from cosmoglobe.sky._base_components import DiffuseComponent
+from cosmoglobe.sky._base_components import DiffuseComponent, broadcast_ravel
 from cosmoglobe.sky.components._labels import SkyComponentLabel
 
 
@@ -32,4 +34,31 @@ class PowerLaw(DiffuseComponent):
     def get_freq_scaling(self, freqs: Quantity, beta: Quantity) -> Quantity:
         """See base class."""
 
-        return (freqs / self.freq_ref) ** beta
+        # The frequency ratio is scalar-like while beta may be a full-sky
+        # map; computing the ratio on raw values up front leaves a single
+        # pow over beta instead of a broadcast Quantity divide + pow.
+        beta_value = np.asarray(beta.value, dtype=np.float64)
+        ratio = freqs.to_value("GHz") / self._freq_ref_ghz
+
+        broadcast_shape = np.broadcast_shapes(np.shape(ratio), beta_value.shape)
+        ratio, beta_value = broadcast_ravel(broadcast_shape, ratio, beta_value)
+        scaling = _powerlaw_scaling(ratio, beta_value, self._get_scratch(ratio.size))
+
+        return Quantity(scaling.reshape(broadcast_shape), copy=False)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _powerlaw_scaling(
+    ratio: np.ndarray, beta: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Returns the power law SED scaling factor.
+
+    Evaluates ratio^beta in a parallel pass over the pixels, writing
+    into `out`. All inputs must be 1-dimensional arrays of a common
+    size.
+    """
+
+    for pixel in prange(beta.size):
+        out[pixel] = ratio[pixel] ** beta[pixel]
+
+    return out
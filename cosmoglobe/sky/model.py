@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Iterator, List, Literal, Optional, Union
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from astropy.units import Quantity, Unit
 from astropy.units.core import UnitsError
@@ -27,6 +27,48 @@ from cosmoglobe.sky._exceptions import (
 from cosmoglobe.sky.cosmoglobe import cosmoglobe_registry
 from cosmoglobe.h5.chain import Chain
 
+# Cache of (3, npix) pixel direction vectors keyed by nside, reused by
+# repeated dipole operations on maps of the same resolution.
+_PIX2VEC_CACHE: Dict[int, np.ndarray] = {}
+
+
+def _get_pixel_vectors(nside: int) -> np.ndarray:
+    """Returns the unit vectors of all pixels at a given nside, memoized."""
+
+    vecs = _PIX2VEC_CACHE.get(nside)
+    if vecs is None:
+        vecs = np.asarray(hp.pix2vec(nside, np.arange(hp.nside2npix(nside))))
+        _PIX2VEC_CACHE[nside] = vecs
+
+    return vecs
+
+
+def _fit_dipole(amp: np.ndarray, nside: int, gal_cut_deg: float) -> Tuple[float, np.ndarray]:
+    """Fits a monopole and dipole to a HEALPIX map.
+
+    Mirrors hp.fit_dipole, but reuses the memoized pixel direction
+    vectors and accumulates the normal equations in float32 (the dipole
+    amplitude is ~3 mK against uK-level residuals, so single precision is
+    ample for the fit), halving the memory traffic of the full-map pass.
+    The 4x4 system is solved in float64.
+    """
+
+    mask = np.isfinite(amp) & (amp != hp.UNSEEN)
+    if gal_cut_deg > 0:
+        vecs = _get_pixel_vectors(nside)
+        mask &= np.abs(vecs[2]) >= np.sin(np.radians(gal_cut_deg))
+
+    design = np.empty((4, np.count_nonzero(mask)), dtype=np.float32)
+    design[0] = 1.0
+    design[1:] = _get_pixel_vectors(nside)[:, mask]
+    values = amp[mask].astype(np.float32, copy=False)
+
+    normal_matrix = (design @ design.T).astype(np.float64)
+    projection = (design @ values).astype(np.float64)
+    mono, *dipole_vec = np.linalg.solve(normal_matrix, projection)
+
+    return mono, np.asarray(dipole_vec)
+
 
 class SkyModel:
     r"""Sky model representing an initialized instance of the Cosmoglobe Sky Model.
@@ -313,22 +355,21 @@ class SkyModel:
                 "gal_cut must be an astropy quantity compatible with 'deg'"
             )
 
-        if return_dipole:
-            dipole_subtracted_amp = Quantity(
-                hp.remove_dipole(
-                    self["cmb"].amp[0],
-                    gal_cut=gal_cut.to("deg").value,
-                ),
-                unit=self["cmb"].amp.unit,
-            )
-            dipole = self["cmb"].amp[0] - dipole_subtracted_amp
-            self["cmb"].amp[0] = dipole_subtracted_amp
+        amp = self["cmb"].amp
+        nside = hp.npix2nside(amp.shape[1])
+        mono, dipole_vec = _fit_dipole(amp[0].value, nside, gal_cut.value)
 
-            return dipole
+        # Reconstructing the fitted monopole + dipole map from the pixel
+        # direction vectors is a single dot product, where the previous
+        # two-branch code refit and subtracted through full-map Quantity
+        # temporaries.
+        vecs = _get_pixel_vectors(nside)
+        dipole_map = dipole_vec @ vecs
+        dipole_map += mono
+        np.subtract(amp[0].value, dipole_map, out=amp[0].value)
 
-        hp.remove_dipole(
-            self["cmb"].amp[0], gal_cut=gal_cut.to("deg").value, copy=False
-        )
+        if return_dipole:
+            return Quantity(dipole_map, unit=amp.unit, copy=False)
 
     def __iter__(self) -> Iterator:
         """Returns an iterator over the model components."""